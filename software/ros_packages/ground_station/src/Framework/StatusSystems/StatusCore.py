@@ -3,6 +3,7 @@
 
 import rclpy
 from rclpy.node import Node
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy, DurabilityPolicy
 from rover2_status_interface.msg import *
 from PyQt5 import QtWidgets, QtCore, QtGui, uic
 from std_msgs.msg import Empty
@@ -40,6 +41,14 @@ CRITICAL_BATTERY_DIALOG_TIMEOUT = 30
 
 SCREEN = "onescreen" #left
 
+# The gps and jetson topics are published best effort; those subscriptions have
+# to request the same reliability or DDS will not match them to the publishers.
+# The change-triggered topics (camera, frsky, misc, battery) are reliable.
+STATUS_QOS = QoSProfile(depth=1,
+                        history=HistoryPolicy.KEEP_LAST,
+                        reliability=ReliabilityPolicy.BEST_EFFORT,
+                        durability=DurabilityPolicy.VOLATILE)
+
 
 class SensorCore(QtCore.QThread):
     # ########## create signals for slots ##########
@@ -134,8 +143,8 @@ class SensorCore(QtCore.QThread):
 
         self.camera_status = self.status_core_node.create_subscription(CameraStatuses, CAMERA_TOPIC_NAME, self.__camera_callback, 1)
         self.frsky_status = self.status_core_node.create_subscription(FrSkyStatus, FRSKY_TOPIC_NAME, self.__frsky_callback, 1)
-        self.gps_status = self.status_core_node.create_subscription(GPSInfo, GPS_TOPIC_NAME, self.__gps_callback, 1)
-        self.jetson_status = self.status_core_node.create_subscription(JetsonInfo, JETSON_TOPIC_NAME, self.__jetson_callback, 1)
+        self.gps_status = self.status_core_node.create_subscription(GPSInfo, GPS_TOPIC_NAME, self.__gps_callback, STATUS_QOS)
+        self.jetson_status = self.status_core_node.create_subscription(JetsonInfo, JETSON_TOPIC_NAME, self.__jetson_callback, STATUS_QOS)
         self.misc_status = self.status_core_node.create_subscription(MiscStatuses, MISC_TOPIC_NAME, self.__misc_callback, 1)
         self.battery_status = self.status_core_node.create_subscription(BatteryStatusMessage, BATTERY_TOPIC_NAME, self.__battery_callback, 1)
         #self.co2_status = self.status_core_node.create_subscription(UInt16, CO2_TOPIC_NAME, self.__co2_callback, 1)
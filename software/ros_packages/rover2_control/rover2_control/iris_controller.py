@@ -19,11 +19,16 @@
 # Python native imports
 import rclpy
 from rclpy.node import Node
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy, DurabilityPolicy
 
-from time import time, sleep
+from time import monotonic, sleep
+
+import fcntl
+import struct
+import threading
 
 import serial.rs485
-import minimalmodbus
+from pymodbus.client.sync import ModbusSerialClient
 
 # Custom Imports
 from rover2_control_interface.msg import DriveCommandMessage, IrisStatusMessage
@@ -44,49 +49,72 @@ COMMUNICATIONS_TIMEOUT = 0.15  # Seconds
 
 MODBUS_ID = 1
 
-RX_DELAY = 0.01
-TX_DELAY = 0.01
-
-SBUS_VALUES = {
-    "SBUS_MAX": 1811,
-    "SBUS_MID": 991,
-    "SBUS_MIN": 172,
-    "SBUS_RANGE": 820.0,
-
-    "SBUS_DEADZONE": 5
-}
-
-MODBUS_REGISTERS = {
-    "LEFT_STICK_Y_AXIS": 0,
-    "RIGHT_STICK_Y_AXIS": 1,
-    "RIGHT_STICK_X_AXIS": 2,
-    "LEFT_STICK_X_AXIS": 3,
-    "LEFT_POT": 4,
-    "S1_POT": 5,
-    "S2_POT": 6,
-    "RIGHT_POT": 7,
-    "SA_SWITCH": 8,
-    "SB_SWITCH": 9,
-    "SC_SWITCH": 10,
-    "SD_SWITCH": 11,
-    "SE_SWITCH": 12,
-    "SF_SWITCH": 13,
-    "SG_SWITCH": 14,
-    "SH_SWITCH": 15,
-
-    "VOLTAGE_24V": 16,
-    "VOLTAGE_5V": 17,
-    "USB_VOLTAGE_5V": 18,
-    "VOLTAGE_3V3": 19
-}
-
-REGISTER_STATE_MAPPING = {
-    "IGNORE_CONTROL": "SF_SWITCH",
-    "DRIVE_VS_ARM": "SE_SWITCH"
-}
+# RTU silent interval is 3.5 character times, one character being 11 bits on the wire
+SILENT_INTERVAL_CHARACTER_TIMES = 3.5
+BITS_PER_MODBUS_CHARACTER = 11
+
+# serial_struct ioctls for setting the kernel low latency flag, equivalent to
+# "setserial /dev/rover/ttyIRIS low_latency"
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+SERIAL_STRUCT_SIZE = 48
+SERIAL_STRUCT_FLAGS_OFFSET = 16
+ASYNC_LOW_LATENCY = 0x2000
+
+# SBUS values and register indices are plain module constants so hot path code
+# can load them directly instead of hashing string keys into dicts
+SBUS_MAX = 1811
+SBUS_MID = 991
+SBUS_MIN = 172
+SBUS_RANGE = 820.0
+
+SBUS_DEADZONE = 5
+
+LEFT_STICK_Y_AXIS = 0
+RIGHT_STICK_Y_AXIS = 1
+RIGHT_STICK_X_AXIS = 2
+LEFT_STICK_X_AXIS = 3
+LEFT_POT = 4
+S1_POT = 5
+S2_POT = 6
+RIGHT_POT = 7
+SA_SWITCH = 8
+SB_SWITCH = 9
+SC_SWITCH = 10
+SD_SWITCH = 11
+SE_SWITCH = 12
+SF_SWITCH = 13
+SG_SWITCH = 14
+SH_SWITCH = 15
+
+VOLTAGE_24V = 16
+VOLTAGE_5V = 17
+USB_VOLTAGE_5V = 18
+VOLTAGE_3V3 = 19
+
+NUM_MODBUS_REGISTERS = 20
+
+# Which switches control the iris states
+IGNORE_CONTROL_REGISTER = SF_SWITCH
+DRIVE_VS_ARM_REGISTER = SE_SWITCH
 
 IRIS_LAST_SEEN_TIMEOUT = 1  # seconds
 
+# Republish an unchanged drive command every this many ticks (0.2 s at the
+# default 10 Hz) so downstream consumers still get a heartbeat when the sticks
+# are held steady. Must stay inside the drive coordinator's 0.3 second watchdog
+# with margin for jitter, or it zeroes the motors between heartbeats.
+DRIVE_HEARTBEAT_TICKS = 2
+
+# For the periodic iris status only: the latest sample matters and a drop is
+# replaced next tick, so skip reliable delivery's ack path and retry buffers.
+# The drive command stays RELIABLE -- it is change-triggered with a heartbeat,
+# and one dropped heartbeat would trip the drive coordinator's watchdog.
+STATUS_QOS = QoSProfile(depth=1,
+                        history=HistoryPolicy.KEEP_LAST,
+                        reliability=ReliabilityPolicy.BEST_EFFORT,
+                        durability=DurabilityPolicy.VOLATILE)
+
 
 #####################################
 # IrisController Class Definition
@@ -103,53 +131,145 @@ class IrisController(Node):
 
         self.wait_time = 1.0 / self.declare_parameter('~hertz', DEFAULT_HERTZ).value
 
-        self.iris = minimalmodbus.Instrument(self.port, MODBUS_ID)
-        self.__setup_minimalmodbus_for_485()
+        self.iris = ModbusSerialClient(method="rtu", port=self.port, baudrate=self.baud,
+                                       timeout=COMMUNICATIONS_TIMEOUT)
+        self.__setup_modbus_client_for_485()
 
         self.drive_command_publisher = self.create_publisher(DriveCommandMessage, self.drive_command_publisher_topic, 1)
-        self.iris_status_publisher = self.create_publisher(IrisStatusMessage, self.iris_status_publisher_topic, 1)
-
-        self.registers = []
+        self.iris_status_publisher = self.create_publisher(IrisStatusMessage, self.iris_status_publisher_topic,
+                                                           STATUS_QOS)
+
+        # Keep the hot path values as instance attributes so the timer callbacks
+        # avoid repeated global lookups and the division on every tick
+        self.idx_mode = DRIVE_VS_ARM_REGISTER
+        self.idx_ignore = IGNORE_CONTROL_REGISTER
+        self.idx_left_y = LEFT_STICK_Y_AXIS
+        self.idx_right_y = RIGHT_STICK_Y_AXIS
+        self.idx_voltage_24v = VOLTAGE_24V
+
+        self.sbus_mid = SBUS_MID
+        self.sbus_deadzone = SBUS_DEADZONE
+        self.sbus_arm_threshold = SBUS_MIN + SBUS_DEADZONE
+        self.inverse_sbus_range = 1.0 / SBUS_RANGE
+
+        # The register values the broadcast methods consume, unpacked from each
+        # snapshot in main_loop so the publish paths never subscript the list
+        self.mode_value = 0
+        self.ignore_value = 0
+        self.left_y_axis = 0
+        self.right_y_axis = 0
+        self.voltage_24v = 0
+
+        # Reused message instances; the fields are overwritten each tick and the
+        # publish call serializes them, so nothing needs a fresh object
+        self.drive_command = DriveCommandMessage()
+        self.iris_status = IrisStatusMessage()
+        self.iris_status.iris_connected = True
+
+        # Last published drive state, used to skip publishes when nothing moved
+        self.previous_drive_state = None
+        self.ticks_since_drive_publish = 0
+
+        # Latest-only buffer filled by the poll thread so slow serial transactions
+        # never stall the publishing timer
+        self.latest_registers = None
+        self.registers_lock = threading.Lock()
 
         self.iris_connected = False
 
-        self.iris_last_seen_time = time()
+        self.iris_last_seen_time = monotonic()
+
+        self.poll_thread = threading.Thread(target=self.poll_registers_forever, daemon=True)
+        self.poll_thread.start()
 
         self.timer = self.create_timer(self.wait_time, self.main_loop)
 
-    def __setup_minimalmodbus_for_485(self):
-        self.iris.serial = serial.rs485.RS485(self.port, baudrate=self.baud, timeout=COMMUNICATIONS_TIMEOUT)
-        self.iris.serial.rs485_mode = serial.rs485.RS485Settings(rts_level_for_rx=1, rts_level_for_tx=0,
-                                                                 delay_before_rx=RX_DELAY, delay_before_tx=TX_DELAY)
+    def __setup_modbus_client_for_485(self):
+        # The RTU silent interval already gives the transceiver time to turn around,
+        # so no extra delays are added before rx/tx like minimalmodbus needed
+        self.iris.silent_interval = SILENT_INTERVAL_CHARACTER_TIMES * BITS_PER_MODBUS_CHARACTER / self.baud
 
-    def main_loop(self):
+        if not self.iris.connect():
+            # Leave reconnection to the poll loop; the not-seen timeout restarts us
+            print(f"IRIS: Could not open {self.port}")
+            return
+
+        # Native rs485 mode needs the TIOCSRS485 ioctl, which the FTDI adapter on the
+        # iris board does not implement (pyserial raises ValueError there). The FTDI
+        # part drives the transceiver direction in hardware, so just log and move on.
         try:
-            self.read_registers()
-            self.broadcast_drive_if_current_mode()
-            self.broadcast_arm_if_current_mode()
-            self.broadcast_iris_status()
+            self.iris.socket.rs485_mode = serial.rs485.RS485Settings(rts_level_for_rx=1, rts_level_for_tx=0)
+        except (ValueError, OSError) as error:
+            print(f"IRIS: Could not set native RS485 mode on {self.port}: {error}")
 
-        except Exception as error:
-            print(f"IRIS: Error occurred: {error}")
+        self.__set_serial_low_latency()
+
+    def __set_serial_low_latency(self):
+        # USB serial adapters batch received bytes on a ~16 ms latency timer by default,
+        # which dominates each modbus transaction. The low latency flag makes the kernel
+        # hand bytes over as soon as they arrive.
+        try:
+            buffer = fcntl.ioctl(self.iris.socket.fd, TIOCGSERIAL, b'\x00' * SERIAL_STRUCT_SIZE)
+            flags = struct.unpack_from("i", buffer, SERIAL_STRUCT_FLAGS_OFFSET)[0] | ASYNC_LOW_LATENCY
+            buffer = buffer[:SERIAL_STRUCT_FLAGS_OFFSET] + struct.pack("i", flags) + \
+                buffer[SERIAL_STRUCT_FLAGS_OFFSET + 4:]
+            fcntl.ioctl(self.iris.socket.fd, TIOCSSERIAL, buffer)
+        except (OSError, AttributeError) as error:
+            print(f"IRIS: Could not set low latency on {self.port}: {error}")
 
-        if (time() - self.iris_last_seen_time) > IRIS_LAST_SEEN_TIMEOUT:
+    def main_loop(self):
+        with self.registers_lock:
+            registers = self.latest_registers
+
+        if registers is not None:
+            # Unpack the snapshot once; everything after this reads attributes
+            self.mode_value = registers[self.idx_mode]
+            self.ignore_value = registers[self.idx_ignore]
+            self.left_y_axis = registers[self.idx_left_y]
+            self.right_y_axis = registers[self.idx_right_y]
+            self.voltage_24v = registers[self.idx_voltage_24v]
+
+            try:
+                self.broadcast_drive_if_current_mode()
+                self.broadcast_arm_if_current_mode()
+                self.broadcast_iris_status()
+
+            except Exception as error:
+                print(f"IRIS: Error occurred: {error}")
+
+        if (monotonic() - self.iris_last_seen_time) > IRIS_LAST_SEEN_TIMEOUT:
             print(f"Iris not seen for {IRIS_LAST_SEEN_TIMEOUT} seconds. Exiting.")
             self.destroy_node()
             return  # Exit so respawn can take over
 
+    def poll_registers_forever(self):
+        while rclpy.ok():
+            self.read_registers()
+            sleep(self.wait_time)
+
     def read_registers(self):
         try:
-            self.registers = self.iris.read_registers(0, len(MODBUS_REGISTERS))
-            self.iris_last_seen_time = time()
+            response = self.iris.read_holding_registers(0, NUM_MODBUS_REGISTERS, unit=MODBUS_ID)
+
+            if response.isError():
+                self.iris_connected = False
+                return
+
+            with self.registers_lock:
+                self.latest_registers = response.registers
+
+            self.iris_last_seen_time = monotonic()
         except Exception as error:
             self.iris_connected = False
 
     def broadcast_drive_if_current_mode(self):
-        if self.registers[MODBUS_REGISTERS[REGISTER_STATE_MAPPING["DRIVE_VS_ARM"]]] < SBUS_VALUES["SBUS_MID"]:
-            command = DriveCommandMessage()
+        sbus_mid = self.sbus_mid
 
-            left_y_axis = self.registers[MODBUS_REGISTERS["LEFT_STICK_Y_AXIS"]]
-            right_y_axis = self.registers[MODBUS_REGISTERS["RIGHT_STICK_Y_AXIS"]]
+        if self.mode_value < sbus_mid:
+            command = self.drive_command
+
+            left_y_axis = self.left_y_axis
+            right_y_axis = self.right_y_axis
 
             if left_y_axis == 0 and right_y_axis == 0:
                 command.controller_present = False
@@ -157,30 +277,47 @@ class IrisController(Node):
                 command.drive_twist.linear.x = 0.0
                 command.drive_twist.angular.z = 0.0
             else:
+                # Zero out stick noise around center so a resting controller maps to
+                # an exact stop instead of a slow creep
+                deadzone = self.sbus_deadzone
+
+                left_offset = left_y_axis - sbus_mid
+                right_offset = right_y_axis - sbus_mid
+
+                if -deadzone <= left_offset <= deadzone:
+                    left_offset = 0
 
-                left = (left_y_axis - SBUS_VALUES["SBUS_MID"]) / SBUS_VALUES[
-                    "SBUS_RANGE"]
+                if -deadzone <= right_offset <= deadzone:
+                    right_offset = 0
 
-                right = (right_y_axis - SBUS_VALUES["SBUS_MID"]) / SBUS_VALUES[
-                    "SBUS_RANGE"]
+                left = left_offset * self.inverse_sbus_range
+                right = right_offset * self.inverse_sbus_range
 
                 command.controller_present = True
-                command.ignore_drive_control = \
-                    self.registers[MODBUS_REGISTERS[REGISTER_STATE_MAPPING["IGNORE_CONTROL"]]] > SBUS_VALUES["SBUS_MID"]
+                command.ignore_drive_control = self.ignore_value > sbus_mid
                 command.drive_twist.linear.x = (left + right) / 2.0
                 command.drive_twist.angular.z = (right - left) / 2.0
 
-            self.drive_command_publisher.publish(command)
+            # Only publish on change, plus a periodic heartbeat so subscribers that
+            # join late still get the current state. Same diff-then-publish pattern
+            # the system statuses node uses.
+            drive_state = (command.controller_present, command.ignore_drive_control,
+                           command.drive_twist.linear.x, command.drive_twist.angular.z)
+
+            self.ticks_since_drive_publish += 1
+
+            if drive_state != self.previous_drive_state or self.ticks_since_drive_publish >= DRIVE_HEARTBEAT_TICKS:
+                self.previous_drive_state = drive_state
+                self.ticks_since_drive_publish = 0
+                self.drive_command_publisher.publish(command)
 
     def broadcast_arm_if_current_mode(self):
-        if self.registers[MODBUS_REGISTERS[REGISTER_STATE_MAPPING["DRIVE_VS_ARM"]]] > \
-                        SBUS_VALUES["SBUS_MIN"] + SBUS_VALUES["SBUS_DEADZONE"]:
+        if self.mode_value > self.sbus_arm_threshold:
             print("Arm")
 
     def broadcast_iris_status(self):
-        status_message = IrisStatusMessage()
-        status_message.iris_connected = True
-        status_message.voltage_24v = self.registers[MODBUS_REGISTERS["VOLTAGE_24V"]]
+        status_message = self.iris_status
+        status_message.voltage_24v = self.voltage_24v
         self.iris_status_publisher.publish(status_message)
 
 
@@ -31,15 +31,24 @@
 # Python native imports
 import rclpy
 from rclpy.node import Node
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy, DurabilityPolicy
 import os.path
 import psutil
 import pynmea2
 import subprocess
+import json
 from rover2_status_interface.msg import BatteryStatusMessage, CameraStatuses, WheelStatuses, FrSkyStatus, GPSInfo, MiscStatuses, JetsonInfo, MotorStatus
 from rover2_control_interface.msg import DriveCommandMessage, DriveStatusMessage, IrisStatusMessage
 from std_msgs.msg import Empty
 from nmea_msgs.msg import Sentence
-from time import time
+from time import monotonic
+
+# inotify lets us skip re-statting the camera devices when nothing was plugged
+# or unplugged; fall back to plain polling where the module is unavailable
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 
 #####################################
@@ -70,6 +79,32 @@ DEFAULT_GPS_NMEA_TOPIC_NAME = '/rover_odometry/gps/sentence'
 NODE_NAME = 'SystemStatuses'
 DEFAULT_HERTZ = 10
 
+# The jetson usage information shells out to sensors and stats the filesystems,
+# which is far too expensive to redo at the full loop rate
+SLOW_UPDATE_WAIT_TIME = 1.0 / MAX_JETSON_UPDATE_HERTZ  # Seconds
+
+# GPU temperature chip names seen across jetpack versions, normalized to
+# lowercase with underscores (see __matches_gpu_sensor for why)
+JETSON_GPU_TEMPERATURE_SENSORS = ('gpu_thermal', 'gpu_therm', 'thermal_fan_est')
+FALLBACK_THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# Directory the camera device symlinks live in, watched for hotplug events
+CAMERA_DEVICE_DIRECTORY = '/dev/rover'
+
+# The only NMEA sentence types __set_gps_info actually reads
+CONSUMED_NMEA_SENTENCE_TYPES = ('GGA', 'VTG')
+
+# For the quasi-periodic jetson and gps telemetry, and for subscribing to the
+# periodic iris status: a dropped sample is replaced by the next one, so skip
+# reliable delivery's ack path and retry buffers. The change-triggered topics
+# (battery, cameras, wheels, frsky, misc) publish each state exactly once and
+# stay RELIABLE -- one dropped sample there would leave consumers stale until
+# the next state change.
+STATUS_QOS = QoSProfile(depth=1,
+                        history=HistoryPolicy.KEEP_LAST,
+                        reliability=ReliabilityPolicy.BEST_EFFORT,
+                        durability=DurabilityPolicy.VOLATILE)
+
 
 #####################################
 # SystemStatuses Class Definition
@@ -86,6 +121,24 @@ class SystemStatuses(Node):
             '/dev/rover/camera_main_navigation'
         ]
 
+        # Presence flags packed as bytes so the change check is one contiguous
+        # compare instead of four attribute pairs
+        self.camera_present = bytearray(len(self.system_path_locations))
+        self.previous_camera_present = bytearray(len(self.system_path_locations))
+
+        # Watch the device directory so the cameras only get re-statted when
+        # something was actually plugged or unplugged. The watch is created
+        # before the initial stat below so no hotplug event can slip between.
+        self.device_watcher = None
+        if INotify is not None:
+            try:
+                self.device_watcher = INotify()
+                self.device_watcher.add_watch(CAMERA_DEVICE_DIRECTORY,
+                                              inotify_flags.CREATE | inotify_flags.DELETE)
+            except OSError:
+                self.device_watcher = None
+        self.__set_cameras()
+
         # filesystem paths for EMMC [0] and NVME_SSD [1]
         # -- UPDATE [1] FOR JETSON --
         self.file_systems_EMMC_NVMe_SSD = [
@@ -93,6 +146,22 @@ class SystemStatuses(Node):
             '/dev/shm'
         ]
 
+        # Keep /proc/stat open and compute cpu usage from deltas ourselves, which
+        # avoids the per-cpu list psutil.cpu_percent allocates on every call
+        try:
+            self.proc_stat_file = open('/proc/stat', 'rb')
+        except OSError:
+            self.proc_stat_file = None
+        self.previous_cpu_busy = 0
+        self.previous_cpu_total = 0
+
+        # Same treatment for ram usage; psutil.virtual_memory parses all of
+        # /proc/meminfo when only two of its fields are needed
+        try:
+            self.proc_meminfo_file = open('/proc/meminfo', 'rb')
+        except OSError:
+            self.proc_meminfo_file = None
+
         self.wait_time = 1.0 / self.declare_parameter("~hertz", DEFAULT_HERTZ).value
 
         # Get Topic Names
@@ -117,8 +186,8 @@ class SystemStatuses(Node):
         self.pub_camera = self.create_publisher(CameraStatuses, self.camera_topic_name, 1)
         self.pub_wheel = self.create_publisher(WheelStatuses, self.wheel_topic_name, 1)
         self.pub_FrSky = self.create_publisher(FrSkyStatus, self.frsky_topic_name, 1)
-        self.pub_GPS = self.create_publisher(GPSInfo, self.gps_topic_name, 1)
-        self.pub_jetson = self.create_publisher(JetsonInfo,self.jetson_topic_name,  1)
+        self.pub_GPS = self.create_publisher(GPSInfo, self.gps_topic_name, STATUS_QOS)
+        self.pub_jetson = self.create_publisher(JetsonInfo, self.jetson_topic_name, STATUS_QOS)
         self.pub_Misc = self.create_publisher(MiscStatuses, self.misc_topic_name, 1)
 
         # Subscribers
@@ -141,34 +210,45 @@ class SystemStatuses(Node):
 
         # init all message values
         self.__pull_new_message_values()
+        self.__pull_slow_message_values()
         self.__instantiate_subscribers()
 
         # init all previous values
         self.__update_all_previous_values()
-        self.last_jetson_message_sent = time()
-        self.last_iris_message_sent = time()
+        self.last_jetson_message_sent = monotonic()
+        self.last_iris_message_sent = monotonic()
 
         self.timer = self.create_timer(self.wait_time, self.main_loop)
+        self.slow_timer = self.create_timer(SLOW_UPDATE_WAIT_TIME, self.slow_loop)
 
-    # init all RoverSysMessage values
+    # init the cheap RoverSysMessage values, pulled at the full loop rate
     def __pull_new_message_values(self):
         self.__set_arm_connection_status()
         self.__set_arm_end_effector_connection_statuses()
-        self.__set_cameras()
+        self.__update_cameras_if_changed()
         self.__set_sample_containment_connection_status()
         self.__set_tower_connection_status()
         self.__set_chassis_pan_tilt_connection_status()
-        self.__set_jetson_usage_information()
-        self.__set_frsky_controller_connection_status()
 #############Initiate motor message values
         # self.__set_motor_status()
 #############16 February 2019
 
+    # init the expensive values (subprocess and filesystem stats), pulled on the slow timer
+    def __pull_slow_message_values(self):
+        self.__set_jetson_usage_information()
+
     # Pulls the UTC GPS Information (WIP v2.0)
     def __set_gps_info(self, data):
         self.GPS_msg.gps_connected = True
+
+        # Only GGA and VTG are consumed below, so check the raw talker tag
+        # (e.g. "$GPGGA,...") and skip the full pynmea2 parse for everything else
+        sentence = data.sentence
+        if len(sentence) < 6 or sentence[3:6] not in CONSUMED_NMEA_SENTENCE_TYPES:
+            return
+
         try:
-            self.Nmea_Message = pynmea2.parse(data.sentence)
+            self.Nmea_Message = pynmea2.parse(sentence)
         except Exception as e:
             return
 
@@ -193,7 +273,7 @@ class SystemStatuses(Node):
     # Instantiates all subscriber methods
     def __instantiate_subscribers(self):
         # Iris Status Subscriber
-        self.iris_status_sub = self.create_subscription(IrisStatusMessage, self.iris_status_topic_name, self.__iris_status_callback, 1)
+        self.iris_status_sub = self.create_subscription(IrisStatusMessage, self.iris_status_topic_name, self.__iris_status_callback, STATUS_QOS)
 
         # Bogie Wheel Subscribers
         self.bogie_left_sub = self.create_subscription(DriveStatusMessage, self.bogie_left_topic_name, self.__left_wheel_callback, 1)
@@ -202,6 +282,9 @@ class SystemStatuses(Node):
         # GPS NMEA subscriber
         self.gps_nmea_sub = self.create_subscription(Sentence, self.gps_nmea_topic_name, self.__set_gps_info, 1)
 
+        # FrSky Controller Connection Subscriber (WIP)
+        self.frsky_status_sub = self.create_subscription(DriveCommandMessage, '/rover_control/command_control/iris_drive', self.__frsky_callback, 1)
+
     def __iris_status_callback(self, data):
         self.battery_message.battery_voltage = data.voltage_24v
 
@@ -225,16 +308,29 @@ class SystemStatuses(Node):
     def __set_arm_end_effector_connection_statuses(self):
         self.misc_msg.arm_end_effector_connection_statuses = False
 
-    # Sets the Camera values (zed, undercarriage, chassis, and main_nav
+    # Sets the Camera values (zed, undercarriage, chassis, and main_nav)
     def __set_cameras(self):
-            # Check if camera_zed is found
-            self.camera_msg.camera_zed = os.path.exists(self.system_path_locations[0])
-            # Check if camera_undercarriage is found
-            self.camera_msg.camera_undercarriage = os.path.exists(self.system_path_locations[1])
-            # Check if camera_chassis is found
-            self.camera_msg.camera_chassis = os.path.exists(self.system_path_locations[2])
-            # Check if camera_main_navigation is found
-            self.camera_msg.camera_main_navigation = os.path.exists(self.system_path_locations[3])
+        for index, path in enumerate(self.system_path_locations):
+            self.camera_present[index] = os.path.exists(path)
+
+    # Re-stats the camera devices only when inotify saw the device directory
+    # change, so the steady state costs no syscalls beyond one non-blocking read
+    def __update_cameras_if_changed(self):
+        if self.device_watcher is not None:
+            events = self.device_watcher.read(timeout=0)
+            if not events:
+                return
+
+            # If /dev/rover itself goes away (USB hub drop) the kernel removes the
+            # watch and sends IGNORED, after which the fd never reports anything
+            # again -- go back to plain polling so replugged cameras are still seen
+            for event in events:
+                if event.mask & (inotify_flags.IGNORED | inotify_flags.DELETE_SELF):
+                    self.device_watcher.close()
+                    self.device_watcher = None
+                    break
+
+        self.__set_cameras()
 
     # Checks Sample Containment Connection Status (WIP)
     def __set_sample_containment_connection_status(self):
@@ -247,41 +343,111 @@ class SystemStatuses(Node):
     def __set_chassis_pan_tilt_connection_status(self):
         self.misc_msg.chassis_pan_tilt_connection_status = False
 
+    # Overall cpu usage since the previous call, read straight from /proc/stat
+    def __cpu_percent(self):
+        if self.proc_stat_file is None:
+            return psutil.cpu_percent()
+
+        self.proc_stat_file.seek(0)
+        fields = self.proc_stat_file.readline().split()
+
+        # user nice system idle iowait irq softirq
+        times = list(map(int, fields[1:8]))
+        total = sum(times)
+        busy = total - (times[3] + times[4])
+
+        busy_delta = busy - self.previous_cpu_busy
+        total_delta = total - self.previous_cpu_total
+        self.previous_cpu_busy = busy
+        self.previous_cpu_total = total
+
+        return 100.0 * busy_delta / total_delta if total_delta > 0 else 0.0
+
+    # Used ram percent from the MemTotal and MemAvailable lines of /proc/meminfo
+    def __ram_percent(self):
+        if self.proc_meminfo_file is None:
+            return psutil.virtual_memory().percent
+
+        self.proc_meminfo_file.seek(0)
+        total = available = None
+        for line in self.proc_meminfo_file:
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1])
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1])
+                break
+
+        if not total or available is None:
+            return psutil.virtual_memory().percent
+
+        return 100.0 * (total - available) / total
+
     # Get Jetson Statuses (WIP)
     def __set_jetson_usage_information(self):
-        self.jetson_msg.jetson_cpu = psutil.cpu_percent()
-        mem = psutil.virtual_memory()
-        self.jetson_msg.jetson_ram = mem.percent
+        self.jetson_msg.jetson_cpu = self.__cpu_percent()
+        self.jetson_msg.jetson_ram = self.__ram_percent()
         self.jetson_msg.jetson_emmc = self.__used_percent_fs(self.file_systems_EMMC_NVMe_SSD[0])
         self.jetson_msg.jetson_nvme_ssd = self.__used_percent_fs(self.file_systems_EMMC_NVMe_SSD[1])
 
         # Temperature
-        # This try except causes a bunch of annoying messages, but lets it run on non-jetson devices
-        # sets to -1.0 if sensor fails to give it a default value notifying failure to pull
+        # sets to -1.0 if the sensors fail to give it a default value notifying failure to pull
+        self.jetson_msg.jetson_gpu_temp = self.__read_gpu_temperature()
+
+    # The same zone shows up under different names per source: hwmon forbids '-'
+    # so psutil reports "gpu_thermal", older jetpacks expose the thermal zone type
+    # "GPU-therm", and sensors -j appends a bus suffix ("gpu_thermal-virtual-0").
+    # Normalize and prefix-match instead of comparing exactly.
+    def __matches_gpu_sensor(self, chip_name):
+        normalized = chip_name.lower().replace('-', '_')
+        for sensor_name in JETSON_GPU_TEMPERATURE_SENSORS:
+            if normalized == sensor_name or normalized.startswith(sensor_name + '_'):
+                return True
+        return False
+
+    # Reads the GPU temperature from libsensors via psutil, with the sensors JSON
+    # output and a direct sysfs read as backups
+    def __read_gpu_temperature(self):
+        try:
+            for chip_name, entries in psutil.sensors_temperatures().items():
+                if self.__matches_gpu_sensor(chip_name) and entries:
+                    return float(entries[0].current)
+        except Exception:
+            pass
+
+        # No shell and no grep/replace chain here, just one exec and a json parse.
+        # The feature label varies by chip ("temp1", "GPU Temperature", ...), so
+        # take the first *_input reading under the matched chip instead of
+        # hardcoding key names.
         try:
-            sensor_temperatures = subprocess.check_output("sensors | grep temp", shell=True)
-            parsed_temps = sensor_temperatures.replace("\xc2\xb0C","").replace("(crit = ","").replace("temp1:","")\
-                .replace("\n", "").replace("+", "").split()
-            self.jetson_msg.jetson_gpu_temp = float(parsed_temps[4])
-        except subprocess.CalledProcessError:
-            print('sensors call failed (potential reason: on VM)')
-            self.jetson_msg.jetson_gpu_temp = -1.0
+            output = subprocess.run(['sensors', '-j'], capture_output=True, timeout=1).stdout
+            data = json.loads(output)
+            for chip_name, features in data.items():
+                if not self.__matches_gpu_sensor(chip_name):
+                    continue
+                for readings in features.values():
+                    if not isinstance(readings, dict):
+                        continue
+                    for reading_name, value in readings.items():
+                        if reading_name.endswith('_input'):
+                            return float(value)
+        except Exception:
+            pass
+
+        try:
+            with open(FALLBACK_THERMAL_ZONE_PATH) as thermal_zone:
+                return int(thermal_zone.read()) / 1000.0
+        except (OSError, ValueError):
+            print('temperature read failed (potential reason: on VM)')
+            return -1.0
 
     # EMMC and NVMe_SSD used % calculation
     def __used_percent_fs(self, pathname):
         statvfs = os.statvfs(pathname)
-        # percentage :: USED:
-        #   used amount: blocks - bfree
-        #   used%: used_amount / (used_amount + bavail)
-        used_available = (statvfs.f_frsize * statvfs.f_blocks / 1024) - (statvfs.f_frsize * statvfs.f_bfree / 1024.0)
-        used_percent = used_available / (used_available + (statvfs.f_frsize * statvfs.f_bavail / 1024.0))
-        # Round 4 for 2 decimal accuracy
-        value = 100 * round(used_percent, 4)
-        return value
-
-    # Check FrSky Controller Connection Status (WIP)
-    def __set_frsky_controller_connection_status(self):
-        self.create_subscription(DriveCommandMessage, '/rover_control/command_control/iris_drive', self.__frsky_callback, 1)
+        # used%: (blocks - bfree) / ((blocks - bfree) + bavail)
+        # every term shares the same f_frsize scale factor, so it cancels out
+        used = statvfs.f_blocks - statvfs.f_bfree
+        total = used + statvfs.f_bavail
+        return 100.0 * used / total if total else 0.0
 
     def __frsky_callback(self, data):
         self.FrSky_msg.frsky_controller_connection_status = data.controller_present
@@ -297,43 +463,44 @@ class SystemStatuses(Node):
         self.__set_previous_misc_values()
 
     def __set_previous_camera_values(self):
-        self.previous_camera_zed = self.camera_msg.camera_zed
-        self.previous_camera_undercarriage = self.camera_msg.camera_undercarriage
-        self.previous_camera_chassis = self.camera_msg.camera_chassis
-        self.previous_camera_main_navigation = self.camera_msg.camera_main_navigation
+        self.previous_camera_present[:] = self.camera_present
+
+    # Current message fields packed into tuples so the change checks in main_loop
+    # are a single compare instead of a chain of attribute pairs
+    def __current_jetson_values(self):
+        msg = self.jetson_msg
+        return (msg.jetson_cpu, msg.jetson_ram, msg.jetson_emmc, msg.jetson_nvme_ssd, msg.jetson_gpu_temp)
+
+    def __current_wheel_values(self):
+        msg = self.wheel_msg
+        return (msg.front_left, msg.middle_left, msg.rear_left,
+                msg.front_right, msg.middle_right, msg.rear_right)
+
+    def __current_gps_values(self):
+        msg = self.GPS_msg
+        return (msg.gps_connected, msg.gps_fix, msg.num_satellites,
+                msg.horizontal_dilution, msg.kmph, msg.gps_heading)
+
+    def __current_misc_values(self):
+        msg = self.misc_msg
+        return (msg.arm_connection_status, msg.arm_end_effector_connection_statuses,
+                msg.chassis_pan_tilt_connection_status, msg.sample_containment_connection_status,
+                msg.tower_connection_status)
 
     def __set_previous_jetson_values(self):
-        self.previous_jetson_cpu = self.jetson_msg.jetson_cpu
-        self.previous_jetson_ram = self.jetson_msg.jetson_ram
-        self.previous_jetson_emmc = self.jetson_msg.jetson_emmc
-        self.previous_jetson_nvme_ssd = self.jetson_msg.jetson_nvme_ssd
-        self.previous_jetson_gpu_temp = self.jetson_msg.jetson_gpu_temp
+        self.previous_jetson_values = self.__current_jetson_values()
 
     def __set_previous_frsky_value(self):
         self.previous_frsky_controller_connection_status = self.FrSky_msg.frsky_controller_connection_status
 
     def __set_previous_wheel_values(self):
-        self.previous_wheel_front_left = self.wheel_msg.front_left
-        self.previous_wheel_middle_left = self.wheel_msg.middle_left
-        self.previous_wheel_rear_left = self.wheel_msg.rear_left
-        self.previous_wheel_front_right = self.wheel_msg.front_right
-        self.previous_wheel_middle_right = self.wheel_msg.middle_right
-        self.previous_wheel_rear_right = self.wheel_msg.rear_right
+        self.previous_wheel_values = self.__current_wheel_values()
 
     def __set_previous_gps_values(self):
-        self.previous_gps_connected = self.GPS_msg.gps_connected
-        self.previous_gps_fix = self.GPS_msg.gps_fix
-        self.previous_gps_num_satellites = self.GPS_msg.num_satellites
-        self.previous_gps_horizontal_dilution = self.GPS_msg.horizontal_dilution
-        self.previous_gps_kmph = self.GPS_msg.kmph
-        self.previous_gps_heading = self.GPS_msg.gps_heading
+        self.previous_gps_values = self.__current_gps_values()
 
     def __set_previous_misc_values(self):
-        self.previous_arm_connection_status = self.misc_msg.arm_connection_status
-        self.previous_arm_end_effector_connection_statuses = self.misc_msg.arm_end_effector_connection_statuses
-        self.previous_chassis_pan_tilt_connection_status = self.misc_msg.chassis_pan_tilt_connection_status
-        self.previous_sample_containment_connection_status = self.misc_msg.sample_containment_connection_status
-        self.previous_tower_connection_status = self.misc_msg.tower_connection_status
+        self.previous_misc_values = self.__current_misc_values()
 
     def __set_previous_battery_values(self):
         self.previous_battery_voltage = self.battery_message.battery_voltage
@@ -341,38 +508,39 @@ class SystemStatuses(Node):
     def on_update_requested(self,  _):
         self.manual_update_requested = True
 
+    def slow_loop(self):
+        self.__pull_slow_message_values()
+
     def main_loop(self):
+        # One timestamp per tick is plenty for all the throttle checks below
+        now = monotonic()
+
         # Update all message values
         self.__pull_new_message_values()
 
         if (self.battery_message.battery_voltage != self.previous_battery_voltage or
                 self.manual_update_requested):
-            if (time() - self.last_iris_message_sent) > (1.0 / MAX_IRIS_UPDATE_HERTZ):
+            if (now - self.last_iris_message_sent) > (1.0 / MAX_IRIS_UPDATE_HERTZ):
                 self.__set_previous_battery_values()
                 self.pub_battery.publish(self.battery_message)
-                self.last_iris_message_sent = time()
+                self.last_iris_message_sent = now
 
         # Camera Check -- if current value is now different from previous value,
         # update the previous value for cameras and publish to listening Subscribers
-        if (self.camera_msg.camera_zed != self.previous_camera_zed or
-                self.camera_msg.camera_undercarriage != self.previous_camera_undercarriage or
-                self.camera_msg.camera_chassis != self.previous_camera_chassis or
-                self.camera_msg.camera_main_navigation != self.previous_camera_main_navigation or
-                self.manual_update_requested):
+        if self.camera_present != self.previous_camera_present or self.manual_update_requested:
             self.__set_previous_camera_values()
+            self.camera_msg.camera_zed = bool(self.camera_present[0])
+            self.camera_msg.camera_undercarriage = bool(self.camera_present[1])
+            self.camera_msg.camera_chassis = bool(self.camera_present[2])
+            self.camera_msg.camera_main_navigation = bool(self.camera_present[3])
             self.pub_camera.publish(self.camera_msg)
 
         # Placeholder Jetson Info Check
-        if (self.jetson_msg.jetson_cpu != self.previous_jetson_cpu or
-                self.jetson_msg.jetson_ram != self.previous_jetson_ram or
-                self.jetson_msg.jetson_emmc != self.previous_jetson_emmc or
-                self.jetson_msg.jetson_nvme_ssd != self.previous_jetson_nvme_ssd or
-                self.jetson_msg.jetson_gpu_temp != self.previous_jetson_gpu_temp or
-                self.manual_update_requested):
-            if (time() - self.last_jetson_message_sent) > (1.0 / MAX_JETSON_UPDATE_HERTZ):
+        if self.__current_jetson_values() != self.previous_jetson_values or self.manual_update_requested:
+            if (now - self.last_jetson_message_sent) > (1.0 / MAX_JETSON_UPDATE_HERTZ):
                 self.__set_previous_jetson_values()
                 self.pub_jetson.publish(self.jetson_msg)
-                self.last_jetson_message_sent = time()
+                self.last_jetson_message_sent = now
 
         # Placeholder FrSky Controller Check
         if (self.FrSky_msg.frsky_controller_connection_status != self.previous_frsky_controller_connection_status or 
@@ -381,13 +549,7 @@ class SystemStatuses(Node):
             self.pub_FrSky.publish(self.FrSky_msg)
 
         # bogie wheel status check
-        if (self.wheel_msg.front_left != self.previous_wheel_front_left or
-                self.wheel_msg.middle_left != self.previous_wheel_middle_left or
-                self.wheel_msg.rear_left != self.previous_wheel_rear_left or
-                self.wheel_msg.front_right != self.previous_wheel_front_right or
-                self.wheel_msg.middle_right != self.previous_wheel_middle_right or
-                self.wheel_msg.rear_right != self.previous_wheel_rear_right  or
-                self.manual_update_requested):
+        if self.__current_wheel_values() != self.previous_wheel_values or self.manual_update_requested:
             self.__set_previous_wheel_values()
             self.pub_wheel.publish(self.wheel_msg)
 
@@ -399,26 +561,12 @@ class SystemStatuses(Node):
         #     self.pub_GPS.publish(self.GPS_msg)
 
         # GPS info status -- connected, fix, satellites, horizontal dilution, kmph, and heading
-        if (self.GPS_msg.gps_connected != self.previous_gps_connected or
-                self.GPS_msg.gps_fix != self.previous_gps_fix or
-                self.GPS_msg.num_satellites != self.previous_gps_num_satellites or
-                self.GPS_msg.horizontal_dilution != self.previous_gps_horizontal_dilution or
-                self.GPS_msg.kmph != self.previous_gps_kmph or
-                self.GPS_msg.gps_heading != self.previous_gps_heading):
+        if self.__current_gps_values() != self.previous_gps_values:
             self.__set_previous_gps_values()
             self.pub_GPS.publish(self.GPS_msg)
 
         # Placeholder Misc Information check
-        if (self.misc_msg.arm_connection_status !=
-                self.previous_arm_connection_status or
-                self.misc_msg.arm_end_effector_connection_statuses !=
-                self.previous_arm_end_effector_connection_statuses or
-                self.misc_msg.chassis_pan_tilt_connection_status !=
-                self.previous_chassis_pan_tilt_connection_status or
-                self.misc_msg.sample_containment_connection_status !=
-                self.previous_sample_containment_connection_status or
-                self.misc_msg.tower_connection_status != self.previous_tower_connection_status or
-                self.manual_update_requested):
+        if self.__current_misc_values() != self.previous_misc_values or self.manual_update_requested:
             self.__set_previous_misc_values()
             self.pub_Misc.publish(self.misc_msg)
 